@@ -124,6 +124,25 @@ class FileIO(object):
       OSError: if the read failed.
     """
 
+  def readinto(self, buffer_object):
+    """Reads a byte string from the file-like object into a buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the number of bytes to read.
+
+    Returns:
+      int: number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    read_data = self.read(len(buffer_object))
+    read_count = len(read_data)
+    buffer_object[:read_count] = read_data
+    return read_count
+
   @abc.abstractmethod
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
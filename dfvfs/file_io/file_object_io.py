@@ -108,6 +108,30 @@ class FileObjectIO(file_io.FileIO):
     # some file-like object implementations.
     return self._file_object.read(size)
 
+  def readinto(self, buffer_object):
+    """Reads a byte string from the file-like object into a buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the number of bytes to read.
+
+    Returns:
+      int: number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    # Note that most file-like objects, such as those provided by the libyal
+    # Python bindings, do not support readinto.
+    if not hasattr(self._file_object, 'readinto'):
+      return super(FileObjectIO, self).readinto(buffer_object)
+
+    return self._file_object.readinto(buffer_object)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
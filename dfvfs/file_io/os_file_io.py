@@ -128,6 +128,30 @@ class OSFile(file_io.FileIO):
 
     return self._file_object.read(size)
 
+  def readinto(self, buffer_object):
+    """Reads a byte string from the file-like object into a buffer.
+
+    Args:
+      buffer_object (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the number of bytes to read.
+
+    Returns:
+      int: number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    # Note that the pysmdev handle used for devices does not support
+    # readinto.
+    if not hasattr(self._file_object, 'readinto'):
+      return super(OSFile, self).readinto(buffer_object)
+
+    return self._file_object.readinto(buffer_object)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
@@ -180,3 +204,21 @@ class OSFile(file_io.FileIO):
       raise IOError('Not opened.')
 
     return self._size
+
+  def fileno(self):
+    """Retrieves the file descriptor of the file-like object.
+
+    Returns:
+      int: file descriptor of the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened or is a device.
+      OSError: if the file-like object has not been opened or is a device.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if not hasattr(self._file_object, 'fileno'):
+      raise IOError('Unsupported file-like object without file descriptor.')
+
+    return self._file_object.fileno()
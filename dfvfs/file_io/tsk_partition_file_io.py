@@ -50,7 +50,9 @@ class TSKPartitionFile(data_range_io.DataRange):
     self._file_system = resolver.Resolver.OpenFileSystem(
         path_spec, resolver_context=self._resolver_context)
     tsk_volume = self._file_system.GetTSKVolume()
-    tsk_vs, _ = tsk_partition.GetTSKVsPartByPathSpec(tsk_volume, path_spec)
+    tsk_vs, _ = tsk_partition.GetTSKVsPartByPathSpec(
+        tsk_volume, path_spec,
+        tsk_vs_parts=self._file_system.GetTSKVsParts())
 
     if tsk_vs is None:
       raise errors.PathSpecError(
@@ -65,7 +67,7 @@ class TSKPartitionFile(data_range_io.DataRange):
           'Unable to retrieve TSK volume system part data range from path '
           'specification.')
 
-    bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
+    bytes_per_sector = self._file_system.GetBytesPerSector()
     range_offset *= bytes_per_sector
     range_size *= bytes_per_sector
 
@@ -7,6 +7,7 @@ import pyvhdi
 
 from dfvfs.file_io import file_object_io
 from dfvfs.lib import errors
+from dfvfs.lib import mmap_file
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import resolver
 
@@ -36,6 +37,7 @@ class VHDIFile(file_object_io.FileObjectIO):
       file_object.close()
 
     self._parent_vhdi_files = []
+    self._size = None
     self._sub_file_objects = []
 
   def _OpenFileObject(self, path_spec):
@@ -57,6 +59,12 @@ class VHDIFile(file_object_io.FileObjectIO):
     file_object = resolver.Resolver.OpenFileObject(
         path_spec.parent, resolver_context=self._resolver_context)
 
+    # Read a VHD image file that is backed by an operating system file from
+    # a memory map to prevent a read system call per libvhdi read.
+    memory_mapped_file = mmap_file.OpenMemoryMappedFile(file_object)
+    if memory_mapped_file:
+      file_object = memory_mapped_file
+
     vhdi_file = pyvhdi.file()
     vhdi_file.open_file_object(file_object)
 
@@ -144,4 +152,7 @@ class VHDIFile(file_object_io.FileObjectIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
-    return self._file_object.get_media_size()
+    if self._size is None:
+      self._size = self._file_object.get_media_size()
+
+    return self._size
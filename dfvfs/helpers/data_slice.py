@@ -7,9 +7,21 @@ import os
 
 from dfvfs.lib import py2to3
 
+
+# The seek whence value is bound at module level since it is used on
+# the hot path of retrieving file data.
+_SEEK_SET = os.SEEK_SET
+
+
 class DataSlice(object):
   """Data slice interface for file-like objects."""
 
+  # The size of the buffer used to read data for individual offsets.
+  _BUFFER_SIZE = 64 * 1024
+
+  # The maximum size of the read buffer that is reused by GetMemoryView.
+  _MAXIMUM_READ_BUFFER_SIZE = 16 * 1024 * 1024
+
   def __init__(self, file_object):
     """Initializes the data slice.
 
@@ -18,8 +30,80 @@ class DataSlice(object):
     """
     super(DataSlice, self).__init__()
     self._buffer = b''
+    self._buffer_offset = None
     self._file_object = file_object
     self._file_object_size = file_object.get_size()
+    self._read_buffer = None
+
+  def _ReadBuffer(self, buffer_offset):
+    """Reads the buffer.
+
+    Args:
+      buffer_offset (int): offset of the buffer, which should be aligned to
+          the buffer size.
+    """
+    self._buffer_offset = None
+
+    self._file_object.seek(buffer_offset, _SEEK_SET)
+    self._buffer = self._file_object.read(self._BUFFER_SIZE)
+    self._buffer_offset = buffer_offset
+
+  def GetMemoryView(self, start_offset, end_offset):
+    """Retrieves a range of file data as a memory view.
+
+    The file data is read into a buffer that is reused by subsequent calls,
+    which prevents allocating a new byte string per read. Hence the memory
+    view is only valid until the next call and its data needs to be copied
+    if it is retained. Ranges larger than the maximum read buffer size are
+    read into a buffer that is not reused.
+
+    Args:
+      start_offset (int): offset of the start of the range.
+      end_offset (int): offset of the end of the range.
+
+    Returns:
+      memoryview: range of file data.
+
+    Raises:
+      ValueError: if the start or end offset is invalid.
+    """
+    if start_offset < 0 or end_offset < start_offset:
+      raise ValueError('Invalid range: {0:d} - {1:d}'.format(
+          start_offset, end_offset))
+
+    end_offset = min(end_offset, self._file_object_size)
+    if end_offset <= start_offset:
+      return memoryview(b'')
+
+    # Use the buffer if it contains the range of file data.
+    if (self._buffer_offset is not None and
+        self._buffer_offset <= start_offset and
+        end_offset <= self._buffer_offset + len(self._buffer)):
+      buffer_index = start_offset - self._buffer_offset
+      return memoryview(self._buffer)[
+          buffer_index:end_offset - self._buffer_offset]
+
+    read_size = end_offset - start_offset
+    if read_size > self._MAXIMUM_READ_BUFFER_SIZE:
+      read_buffer = bytearray(read_size)
+
+    else:
+      if self._read_buffer is None or len(self._read_buffer) < read_size:
+        self._read_buffer = bytearray(read_size)
+      read_buffer = self._read_buffer
+
+    read_buffer_view = memoryview(read_buffer)[:read_size]
+
+    self._file_object.seek(start_offset, _SEEK_SET)
+
+    if hasattr(self._file_object, 'readinto'):
+      read_count = self._file_object.readinto(read_buffer_view)
+    else:
+      read_data = self._file_object.read(read_size)
+      read_count = len(read_data)
+      read_buffer_view[:read_count] = read_data
+
+    return read_buffer_view[:read_count]
 
   # Since this class implements Python interface functions, the following
   # functions are in lower case as an exception to the normal naming
@@ -46,35 +130,39 @@ class DataSlice(object):
       TypeError: if the type of the key is not supported.
       ValueError: if the step value of a slice is not None.
     """
-    if isinstance(key, py2to3.INTEGER_TYPES):
-      if key < 0:
-        self._file_object.seek(key, os.SEEK_END)
-      else:
-        self._file_object.seek(key, os.SEEK_SET)
-
-      return self._file_object.read(1)
-
-    if not isinstance(key, slice):
+    # Slices are checked first since they are the most common type of key.
+    if isinstance(key, slice):
+      if key.step is not None:
+        raise ValueError('Unsupported slice step: {0!s}'.format(key.step))
+
+      # Note that slice.indices() resolves missing and negative offsets and
+      # limits the offsets to the file data size.
+      start_offset, end_offset, _ = key.indices(self._file_object_size)
+      if end_offset <= start_offset:
+        return b''
+
+      # Use the buffer if it contains the range of file data.
+      if (self._buffer_offset is not None and
+          self._buffer_offset <= start_offset and
+          end_offset <= self._buffer_offset + len(self._buffer)):
+        buffer_index = start_offset - self._buffer_offset
+        return self._buffer[buffer_index:end_offset - self._buffer_offset]
+
+      self._file_object.seek(start_offset, _SEEK_SET)
+      return self._file_object.read(end_offset - start_offset)
+
+    if not isinstance(key, py2to3.INTEGER_TYPES):
       raise TypeError('Unsupported key type: {0!s}'.format(type(key)))
 
-    if key.step is not None:
-      raise ValueError('Unsupported slice step: {0!s}'.format(key.step))
+    if key < 0:
+      key += self._file_object_size
 
-    start_offset = key.start or 0
-    if start_offset < 0:
-      start_offset = 0
-
-    end_offset = key.stop or self._file_object_size
-
-    if end_offset < 0:
-      self._file_object.seek(end_offset, os.SEEK_END)
-      read_size = -(start_offset - end_offset)
-
-    else:
-      self._file_object.seek(start_offset, os.SEEK_SET)
-      read_size = end_offset - start_offset
+    buffer_offset = key - (key % self._BUFFER_SIZE)
+    if buffer_offset != self._buffer_offset:
+      self._ReadBuffer(buffer_offset)
 
-    return self._file_object.read(read_size)
+    buffer_index = key - buffer_offset
+    return self._buffer[buffer_index:buffer_index + 1]
 
   def __len__(self):
     """Retrieves the file data size.
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Helper functions for memory mapped file support."""
+
+from __future__ import unicode_literals
+
+import mmap
+import os
+
+
+class MemoryMappedFile(object):
+  """File-like object that reads from a memory mapped file."""
+
+  def __init__(self, file_object, memory_map):
+    """Initializes a file-like object.
+
+    Args:
+      file_object (FileIO): file-like object that is memory mapped.
+      memory_map (mmap.mmap): memory map of the file-like object.
+    """
+    super(MemoryMappedFile, self).__init__()
+    self._current_offset = 0
+    self._file_object = file_object
+    self._memory_map = memory_map
+    self._size = len(memory_map)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def close(self):
+    """Closes the file-like object and the memory mapped file-like object."""
+    self._memory_map.close()
+    self._memory_map = None
+
+    self._file_object.close()
+    self._file_object = None
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if self._memory_map is None:
+      raise IOError('Not opened.')
+
+    if self._current_offset >= self._size:
+      return b''
+
+    if size is None or size < 0:
+      size = self._size - self._current_offset
+
+    start_offset = self._current_offset
+    self._current_offset = min(start_offset + size, self._size)
+
+    return self._memory_map[start_offset:self._current_offset]
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if self._memory_map is None:
+      raise IOError('Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if self._memory_map is None:
+      raise IOError('Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if self._memory_map is None:
+      raise IOError('Not opened.')
+
+    return self._size
+
+  # Pythonesque alias for get_offset().
+  def tell(self):
+    """Retrieves the current offset into the file-like object."""
+    return self.get_offset()
+
+  def seekable(self):
+    """Determines if a file-like object is seekable.
+
+    Returns:
+      bool: True since a memory mapped file provides a seek method.
+    """
+    return True
+
+
+def OpenMemoryMappedFile(file_object):
+  """Opens a memory mapped file-like object.
+
+  Only file-like objects that are backed by an operating system file, and
+  provide a file descriptor, can be memory mapped.
+
+  Args:
+    file_object (FileIO): file-like object.
+
+  Returns:
+    MemoryMappedFile: memory mapped file-like object or None if the file-like
+        object cannot be memory mapped.
+  """
+  if not hasattr(file_object, 'fileno'):
+    return None
+
+  try:
+    file_descriptor = file_object.fileno()
+
+    # Note that mmap cannot map an empty file and fails for files that do
+    # not fit in the address space.
+    memory_map = mmap.mmap(file_descriptor, 0, access=mmap.ACCESS_READ)
+  except (EnvironmentError, OverflowError, ValueError):
+    return None
+
+  return MemoryMappedFile(file_object, memory_map)
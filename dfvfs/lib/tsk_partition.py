@@ -6,12 +6,15 @@ from __future__ import unicode_literals
 import pytsk3
 
 
-def GetTSKVsPartByPathSpec(tsk_volume, path_spec):
+def GetTSKVsPartByPathSpec(tsk_volume, path_spec, tsk_vs_parts=None):
   """Retrieves the TSK volume system part object from the TSK volume object.
 
   Args:
     tsk_volume (pytsk3.Volume_Info): TSK volume information.
     path_spec (PathSpec): path specification.
+    tsk_vs_parts (Optional[tuple[pytsk3.TSK_VS_PART_INFO]]): TSK volume
+        system parts of the TSK volume, where None represents the parts
+        should be read from the TSK volume.
 
   Returns:
     tuple: contains:
@@ -44,10 +47,13 @@ def GetTSKVsPartByPathSpec(tsk_volume, path_spec):
   current_partition_index = 0
   tsk_vs_part = None
 
-  # pytsk3 does not handle the Volume_Info iterator correctly therefore
-  # the explicit cast to list is needed to prevent the iterator terminating
-  # too soon or looping forever.
-  tsk_vs_part_list = list(tsk_volume)
+  if tsk_vs_parts is not None:
+    tsk_vs_part_list = tsk_vs_parts
+  else:
+    # pytsk3 does not handle the Volume_Info iterator correctly therefore
+    # the explicit cast to list is needed to prevent the iterator terminating
+    # too soon or looping forever.
+    tsk_vs_part_list = list(tsk_volume)
   number_of_tsk_vs_parts = len(tsk_vs_part_list)
 
   if number_of_tsk_vs_parts > 0:
@@ -65,7 +71,9 @@ def GetTSKVsPartByPathSpec(tsk_volume, path_spec):
       if part_index is not None and part_index == current_part_index:
         break
 
-      if start_offset is not None:
+      # Note that multiple parts can have the same start offset, hence an
+      # explicit part index takes precedence over the start offset.
+      if part_index is None and start_offset is not None:
         start_sector = TSKVsPartGetStartSector(tsk_vs_part)
 
         if start_sector is not None:
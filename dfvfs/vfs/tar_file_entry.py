@@ -24,6 +24,20 @@ class TARDirectory(file_entry.Directory):
     Yields:
       TARPathSpec: TAR path specification.
     """
+    for path_spec, _ in self._EntriesWithTARInfoGenerator():
+      yield path_spec
+
+  def _EntriesWithTARInfoGenerator(self):
+    """Retrieves directory entries and their TAR info.
+
+    The entries are yielded sorted by their location. Note that the TAR
+    infos are sorted by their full name, e.g. "b-x" sorts before "b/c",
+    hence the entries are collected before they are yielded.
+
+    Yields:
+      tuple[TARPathSpec, tarfile.TARInfo]: TAR path specification and
+          the corresponding TAR info or None for a virtual directory.
+    """
     location = getattr(self.path_spec, 'location', None)
 
     if location and location.startswith(self._file_system.PATH_SEPARATOR):
@@ -31,17 +45,22 @@ class TARDirectory(file_entry.Directory):
       # the location string does.
       tar_path = location[1:]
 
-      # Set of top level sub directories that have been yielded.
+      # Only the TAR info of which the name starts with the location string
+      # and a path separator can refer to a file in the directory.
+      name_prefix = tar_path
+      if name_prefix and not name_prefix.endswith(
+          self._file_system.PATH_SEPARATOR):
+        name_prefix = '{0:s}{1:s}'.format(
+            name_prefix, self._file_system.PATH_SEPARATOR)
+
+      # Set of top level sub directories that have been processed.
       processed_directories = set()
 
-      tar_file = self._file_system.GetTARFile()
-      for tar_info in iter(tar_file.getmembers()):
-        path = tar_info.name
+      entries = []
 
-        # Determine if the start of the TAR info name is similar to
-        # the location string. If not the file TAR info refers to is not in
-        # the same directory.
-        if not path or not path.startswith(tar_path):
+      for tar_info in self._file_system.GetTARInfosWithNamePrefix(name_prefix):
+        path = tar_info.name
+        if not path:
           continue
 
         # Ignore the directory itself.
@@ -69,9 +88,27 @@ class TARDirectory(file_entry.Directory):
             continue
           processed_directories.add(path_spec_location)
 
-        yield tar_path_spec.TARPathSpec(
+        path_spec = tar_path_spec.TARPathSpec(
             location=path_spec_location, parent=self.path_spec.parent)
 
+        if suffix:
+          # The directory can have a TAR info, which is a single lookup in
+          # the member index of the file system.
+          tar_info = self._file_system.GetTARInfoByPathSpec(path_spec)
+
+        entries.append((path_spec, tar_info))
+
+      for path_spec, tar_info in sorted(
+          entries, key=lambda entry: entry[0].location):
+        yield path_spec, tar_info
+
+  @property
+  def entries_with_tar_info(self):
+    """generator[tuple[TARPathSpec, tarfile.TARInfo]]: path specifications
+        of the directory entries and the corresponding TAR info.
+    """
+    return self._EntriesWithTARInfoGenerator()
+
 
 class TARFileEntry(file_entry.FileEntry):
   """File system file entry that uses tarfile."""
@@ -184,15 +221,13 @@ class TARFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory and tar_file:
-      for path_spec in self._directory.entries:
-        location = getattr(path_spec, 'location', None)
-        if location is None:
-          continue
-
+      # Pass the TAR info, that was determined while listing the directory,
+      # to prevent the file entry from looking it up again.
+      for path_spec, tar_info in self._directory.entries_with_tar_info:
         kwargs = {}
-        try:
-          kwargs['tar_info'] = tar_file.getmember(location[1:])
-        except KeyError:
+        if tar_info is not None:
+          kwargs['tar_info'] = tar_info
+        else:
           kwargs['is_virtual'] = True
 
         yield TARFileEntry(
@@ -256,20 +291,6 @@ class TARFileEntry(file_entry.FileEntry):
       PathSpecError: if the path specification is incorrect.
     """
     if not self._tar_info:
-      location = getattr(self.path_spec, 'location', None)
-      if location is None:
-        raise errors.PathSpecError('Path specification missing location.')
-
-      if not location.startswith(self._file_system.LOCATION_ROOT):
-        raise errors.PathSpecError('Invalid location in path specification.')
-
-      if len(location) == 1:
-        return None
-
-      tar_file = self._file_system.GetTARFile()
-      try:
-        self._tar_info = tar_file.getmember(location[1:])
-      except KeyError:
-        pass
+      self._tar_info = self._file_system.GetTARInfoByPathSpec(self.path_spec)
 
     return self._tar_info
@@ -3,11 +3,13 @@
 
 from __future__ import unicode_literals
 
+import bisect
 import os
 import tarfile
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import mmap_file
 from dfvfs.path import tar_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
@@ -34,6 +36,8 @@ class TARFileSystem(file_system.FileSystem):
     super(TARFileSystem, self).__init__(resolver_context)
     self._file_object = None
     self._tar_file = None
+    self._tar_member_names = None
+    self._tar_members = None
     self.encoding = encoding
 
   def _Close(self):
@@ -44,6 +48,8 @@ class TARFileSystem(file_system.FileSystem):
     """
     self._tar_file.close()
     self._tar_file = None
+    self._tar_member_names = None
+    self._tar_members = None
 
     self._file_object.close()
     self._file_object = None
@@ -70,18 +76,55 @@ class TARFileSystem(file_system.FileSystem):
         path_spec.parent, resolver_context=self._resolver_context)
 
     try:
+      # Read a TAR file that is backed by an operating system file from
+      # a memory map to prevent a read system call per TAR header.
+      memory_mapped_file = mmap_file.OpenMemoryMappedFile(file_object)
+      if memory_mapped_file:
+        file_object = memory_mapped_file
+
       # Set the file offset to 0 because tarfile.open() does not.
       file_object.seek(0, os.SEEK_SET)
 
       # Explicitly tell tarfile not to use compression. Compression should be
       # handled by the file-like object.
       tar_file = tarfile.open(mode='r:', fileobj=file_object)
+
+      # Index the TAR info by name once, tarfile.getmember() does a linear
+      # search of all members on every lookup. If a name occurs more than
+      # once the last occurrence is used, similar to tarfile.getmember().
+      tar_members = {
+          tar_info.name: tar_info for tar_info in tar_file.getmembers()}
+
+      # The sorted names are used to determine virtual directories.
+      tar_member_names = sorted(tar_members.keys())
     except:
       file_object.close()
       raise
 
     self._file_object = file_object
     self._tar_file = tar_file
+    self._tar_member_names = tar_member_names
+    self._tar_members = tar_members
+
+  def _IsVirtualDirectory(self, name):
+    """Determines if a name could be a virtual directory.
+
+    A name could be a virtual directory if it is a parent directory of
+    the name of a member.
+
+    Args:
+      name (str): name without the leading and trailing path separator.
+
+    Returns:
+      bool: True if the name could be a virtual directory.
+    """
+    name_prefix = '{0:s}{1:s}'.format(name, self.PATH_SEPARATOR)
+
+    # Since the names are sorted the first name that is equal to or greater
+    # than the name prefix is the only candidate that needs to be checked.
+    index = bisect.bisect_left(self._tar_member_names, name_prefix)
+    return (index < len(self._tar_member_names) and
+            self._tar_member_names[index].startswith(name_prefix))
 
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
@@ -101,20 +144,15 @@ class TARFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    try:
-      self._tar_file.getmember(location[1:])
-      return True
-    except KeyError:
-      pass
+    # The TAR info name does not have the leading path separator as
+    # the location string does. Similar to tarfile.getmember() a trailing
+    # path separator is ignored.
+    name = location[1:].rstrip(self.PATH_SEPARATOR)
 
-    # Check if location could be a virtual directory.
-    for name in iter(self._tar_file.getnames()):
-      # The TAR info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
+    if name in self._tar_members:
+      return True
 
-    return False
+    return self._IsVirtualDirectory(name)
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -125,24 +163,32 @@ class TARFileSystem(file_system.FileSystem):
     Returns:
       TARFileEntry: file entry or None.
     """
-    if not self.FileEntryExistsByPathSpec(path_spec):
-      return None
-
     location = getattr(path_spec, 'location', None)
 
+    if (location is None or
+        not location.startswith(self.LOCATION_ROOT)):
+      return None
+
     if len(location) == 1:
       return tar_file_entry.TARFileEntry(
           self._resolver_context, self, path_spec, is_root=True,
           is_virtual=True)
 
-    kwargs = {}
-    try:
-      kwargs['tar_info'] = self._tar_file.getmember(location[1:])
-    except KeyError:
-      kwargs['is_virtual'] = True
+    # The TAR info name does not have the leading path separator as
+    # the location string does. Similar to tarfile.getmember() a trailing
+    # path separator is ignored.
+    name = location[1:].rstrip(self.PATH_SEPARATOR)
+
+    tar_info = self._tar_members.get(name, None)
+    if tar_info is not None:
+      return tar_file_entry.TARFileEntry(
+          self._resolver_context, self, path_spec, tar_info=tar_info)
+
+    if not self._IsVirtualDirectory(name):
+      return None
 
     return tar_file_entry.TARFileEntry(
-        self._resolver_context, self, path_spec, **kwargs)
+        self._resolver_context, self, path_spec, is_virtual=True)
 
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
@@ -184,7 +230,28 @@ class TARFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return None
 
-    try:
-      return self._tar_file.getmember(location[1:])
-    except KeyError:
-      pass
+    # Similar to tarfile.getmember() a trailing path separator is ignored.
+    name = location[1:].rstrip(self.PATH_SEPARATOR)
+    return self._tar_members.get(name, None)
+
+  def GetTARInfosWithNamePrefix(self, name_prefix):
+    """Retrieves the TAR infos of which the name starts with a prefix.
+
+    Args:
+      name_prefix (str): name prefix, without the leading path separator.
+
+    Yields:
+      tarfile.TARInfo: TAR info, in order of name.
+    """
+    number_of_names = len(self._tar_member_names)
+
+    # Since the names are sorted the names that start with the prefix are
+    # contiguous.
+    index = bisect.bisect_left(self._tar_member_names, name_prefix)
+    while index < number_of_names:
+      name = self._tar_member_names[index]
+      if not name.startswith(name_prefix):
+        break
+
+      yield self._tar_members[name]
+      index += 1
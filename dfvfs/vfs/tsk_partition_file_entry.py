@@ -22,6 +22,16 @@ class TSKPartitionDirectory(file_entry.Directory):
     Yields:
       TSKPartitionPathSpec: a path specification.
     """
+    for path_spec, _ in self._EntriesWithTSKVsPartGenerator():
+      yield path_spec
+
+  def _EntriesWithTSKVsPartGenerator(self):
+    """Retrieves directory entries and their TSK volume system parts.
+
+    Yields:
+      tuple[TSKPartitionPathSpec, pytsk3.TSK_VS_PART_INFO]: a path
+          specification and the corresponding TSK volume system part.
+    """
     location = getattr(self.path_spec, 'location', None)
     part_index = getattr(self.path_spec, 'part_index', None)
     start_offset = getattr(self.path_spec, 'start_offset', None)
@@ -29,15 +39,11 @@ class TSKPartitionDirectory(file_entry.Directory):
     # Only the virtual root file has directory entries.
     if (part_index is None and start_offset is None and
         location is not None and location == self._file_system.LOCATION_ROOT):
-      tsk_volume = self._file_system.GetTSKVolume()
-      bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
+      bytes_per_sector = self._file_system.GetBytesPerSector()
       part_index = 0
       partition_index = 0
 
-      # pytsk3 does not handle the Volume_Info iterator correctly therefore
-      # the explicit list is needed to prevent the iterator terminating too
-      # soon or looping forever.
-      for tsk_vs_part in list(tsk_volume):
+      for tsk_vs_part in self._file_system.GetTSKVsParts():
         kwargs = {}
 
         if tsk_partition.TSKVsPartIsAllocated(tsk_vs_part):
@@ -54,7 +60,16 @@ class TSKPartitionDirectory(file_entry.Directory):
 
         kwargs['parent'] = self.path_spec.parent
 
-        yield tsk_partition_path_spec.TSKPartitionPathSpec(**kwargs)
+        path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(**kwargs)
+        yield path_spec, tsk_vs_part
+
+  @property
+  def entries_with_tsk_vs_part(self):
+    """generator[tuple[TSKPartitionPathSpec, pytsk3.TSK_VS_PART_INFO]]: path
+        specifications of the directory entries and the corresponding TSK
+        volume system parts.
+    """
+    return self._EntriesWithTSKVsPartGenerator()
 
 
 class TSKPartitionFileEntry(file_entry.FileEntry):
@@ -81,10 +96,10 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
       BackEndError: when the TSK volume system part is missing in a non-virtual
           file entry.
     """
-    tsk_volume = file_system.GetTSKVolume()
     if not is_virtual and tsk_vs_part is None:
       tsk_vs_part, _ = tsk_partition.GetTSKVsPartByPathSpec(
-          tsk_volume, path_spec)
+          file_system.GetTSKVolume(), path_spec,
+          tsk_vs_parts=file_system.GetTSKVsParts())
     if not is_virtual and tsk_vs_part is None:
       raise errors.BackEndError(
           'Missing TSK volume system part in non-virtual file entry.')
@@ -93,7 +108,6 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
         resolver_context, file_system, path_spec, is_root=is_root,
         is_virtual=is_virtual)
     self._name = None
-    self._tsk_volume = tsk_volume
     self._tsk_vs_part = tsk_vs_part
 
     if is_virtual:
@@ -119,8 +133,7 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
     """
     stat_object = super(TSKPartitionFileEntry, self)._GetStat()
 
-    bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(
-        self._tsk_volume)
+    bytes_per_sector = self._file_system.GetBytesPerSector()
 
     # File data stat information.
     if self._tsk_vs_part is not None:
@@ -153,9 +166,12 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
+      # Pass the TSK volume system part, that was determined while iterating
+      # the volume, to prevent the file entry from scanning the volume again.
+      for path_spec, tsk_vs_part in self._directory.entries_with_tsk_vs_part:
         yield TSKPartitionFileEntry(
-            self._resolver_context, self._file_system, path_spec)
+            self._resolver_context, self._file_system, path_spec,
+            tsk_vs_part=tsk_vs_part)
 
   @property
   def name(self):
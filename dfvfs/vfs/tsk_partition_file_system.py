@@ -28,8 +28,10 @@ class TSKPartitionFileSystem(file_system.FileSystem):
       resolver_context (Context): a resolver context.
     """
     super(TSKPartitionFileSystem, self).__init__(resolver_context)
+    self._bytes_per_sector = None
     self._file_object = None
     self._tsk_volume = None
+    self._tsk_vs_parts = None
 
   def _Close(self):
     """Closes the file system object.
@@ -37,7 +39,9 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    self._bytes_per_sector = None
     self._tsk_volume = None
+    self._tsk_vs_parts = None
 
     self._file_object.close()
     self._file_object = None
@@ -66,12 +70,20 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     try:
       tsk_image_object = tsk_image.TSKFileSystemImage(file_object)
       tsk_volume = pytsk3.Volume_Info(tsk_image_object)
+
+      # pytsk3 does not handle the Volume_Info iterator correctly therefore
+      # the volume system parts are read once into a tuple to prevent the
+      # iterator terminating too soon or looping forever.
+      tsk_vs_parts = tuple(tsk_volume)
     except:
       file_object.close()
       raise
 
+    self._bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(
+        tsk_volume)
     self._file_object = file_object
     self._tsk_volume = tsk_volume
+    self._tsk_vs_parts = tsk_vs_parts
 
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
@@ -83,7 +95,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
       bool: True if the file entry exists or false otherwise.
     """
     tsk_vs_part, _ = tsk_partition.GetTSKVsPartByPathSpec(
-        self._tsk_volume, path_spec)
+        self._tsk_volume, path_spec, tsk_vs_parts=self._tsk_vs_parts)
 
     # The virtual root file has not corresponding TSK volume system part object
     # but should have a location.
@@ -93,6 +105,14 @@ class TSKPartitionFileSystem(file_system.FileSystem):
 
     return True
 
+  def GetBytesPerSector(self):
+    """Retrieves the number of bytes per sector.
+
+    Returns:
+      int: number of bytes per sector.
+    """
+    return self._bytes_per_sector
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -103,7 +123,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
       TSKPartitionFileEntry: a file entry or None of not available.
     """
     tsk_vs_part, partition_index = tsk_partition.GetTSKVsPartByPathSpec(
-        self._tsk_volume, path_spec)
+        self._tsk_volume, path_spec, tsk_vs_parts=self._tsk_vs_parts)
 
     location = getattr(path_spec, 'location', None)
 
@@ -121,7 +141,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
       path_spec.location = '/p{0:d}'.format(partition_index)
 
     return tsk_partition_file_entry.TSKPartitionFileEntry(
-        self._resolver_context, self, path_spec)
+        self._resolver_context, self, path_spec, tsk_vs_part=tsk_vs_part)
 
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
@@ -140,3 +160,11 @@ class TSKPartitionFileSystem(file_system.FileSystem):
       pytsk3.Volume_Info: a TSK volume object.
     """
     return self._tsk_volume
+
+  def GetTSKVsParts(self):
+    """Retrieves the TSK volume system parts.
+
+    Returns:
+      tuple[pytsk3.TSK_VS_PART_INFO]: TSK volume system parts.
+    """
+    return self._tsk_vs_parts
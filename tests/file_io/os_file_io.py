@@ -130,6 +130,30 @@ class OSFileTest(shared_test_lib.BaseTestCase):
 
     # TODO: add boundary scenarios.
 
+  def testReadinto(self):
+    """Test the readinto functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+
+    read_buffer = bytearray(24)
+
+    # Try readinto without the file object being open.
+    with self.assertRaises(IOError):
+      file_object.readinto(read_buffer)
+
+    file_object.open(path_spec=self._path_spec1)
+
+    file_object.seek(20, os.SEEK_SET)
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 24)
+    self.assertEqual(read_buffer, b'bank,joesmith,superrich\n')
+
+    file_object.seek(110, os.SEEK_SET)
+    read_count = file_object.readinto(memoryview(read_buffer)[:10])
+    self.assertEqual(read_count, 6)
+    self.assertEqual(read_buffer[:6], b'admin\n')
+
+    file_object.close()
+
   def testGetOffset(self):
     """Test the get offset functionality."""
     file_object = os_file_io.OSFile(self._resolver_context)
@@ -160,6 +184,21 @@ class OSFileTest(shared_test_lib.BaseTestCase):
 
     file_object.close()
 
+  def testFileno(self):
+    """Test the fileno functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+
+    # Try fileno without the file object being open.
+    with self.assertRaises(IOError):
+      file_object.fileno()
+
+    file_object.open(path_spec=self._path_spec1)
+
+    file_descriptor = file_object.fileno()
+    self.assertIsNotNone(file_descriptor)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,8 +4,10 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
+from dfvfs.file_io import vhdi_file_io
 from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.path import vhdi_path_spec
@@ -49,6 +51,22 @@ class DynamicVHDIFileTest(test_lib.Ext2ImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._vhdi_path_spec)
 
+  def testReadinto(self):
+    """Test the readinto functionality."""
+    file_object = vhdi_file_io.VHDIFile(self._resolver_context)
+    file_object.open(path_spec=self._vhdi_path_spec)
+
+    expected_buffer = file_object.read(4096)
+
+    file_object.seek(0, os.SEEK_SET)
+
+    read_buffer = bytearray(4096)
+    read_count = file_object.readinto(memoryview(read_buffer))
+    self.assertEqual(read_count, 4096)
+    self.assertEqual(read_buffer, expected_buffer)
+
+    file_object.close()
+
 
 class DifferentialVHDIFileTest(test_lib.ImageFileTestCase):
   """The unit test for the VHD image file-like object."""
@@ -6,8 +6,10 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.file_io import fake_file_io
 from dfvfs.file_io import os_file_io
 from dfvfs.helpers import data_slice
+from dfvfs.path import fake_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 
@@ -48,9 +50,21 @@ class TextFileTest(shared_test_lib.BaseTestCase):
       self.assertEqual(file_data[:20], b'place,user,password\n')
       self.assertEqual(file_data[64:86], b'treasure chest,-,1111\n')
 
+      # Test offset read.
+      self.assertEqual(file_data[0], b'p')
+      self.assertEqual(file_data[20], b'b')
+      self.assertEqual(file_data[-1], b'\n')
+      self.assertEqual(file_data[-30], b'u')
+      self.assertEqual(file_data[116], b'')
+      self.assertEqual(file_data[44:64], b'alarm system,-,1234\n')
+
       # Test edge cases.
       self.assertEqual(file_data[-150:20], b'place,user,password\n')
       self.assertEqual(file_data[86:150], b'uber secret laire,admin,admin\n')
+      self.assertEqual(file_data[-30:], b'uber secret laire,admin,admin\n')
+      self.assertEqual(file_data[64:-30], b'treasure chest,-,1111\n')
+      self.assertEqual(file_data[0:0], b'')
+      self.assertEqual(file_data[64:44], b'')
 
       with self.assertRaises(TypeError):
         file_data['key']  # pylint: disable=pointless-statement
@@ -61,6 +75,94 @@ class TextFileTest(shared_test_lib.BaseTestCase):
     finally:
       file_object.close()
 
+  def testGetMemoryView(self):
+    """Test the GetMemoryView function."""
+    test_file = self._GetTestFilePath(['password.txt'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(test_path_spec)
+
+    try:
+      file_data = data_slice.DataSlice(file_object)
+
+      memory_view = file_data.GetMemoryView(0, 20)
+      self.assertEqual(memory_view.tobytes(), b'place,user,password\n')
+
+      memory_view = file_data.GetMemoryView(86, 150)
+      self.assertEqual(
+          memory_view.tobytes(), b'uber secret laire,admin,admin\n')
+
+      memory_view = file_data.GetMemoryView(44, 44)
+      self.assertEqual(memory_view.tobytes(), b'')
+
+      # Test read from the buffer used for individual offsets.
+      self.assertEqual(file_data[20], b'b')
+
+      memory_view = file_data.GetMemoryView(20, 44)
+      self.assertEqual(memory_view.tobytes(), b'bank,joesmith,superrich\n')
+
+      with self.assertRaises(ValueError):
+        file_data.GetMemoryView(-1, 20)
+
+      with self.assertRaises(ValueError):
+        file_data.GetMemoryView(64, 44)
+
+    finally:
+      file_object.close()
+
+  # pylint: disable=protected-access
+
+  def testGetMemoryViewLargeRanges(self):
+    """Test the GetMemoryView function with ranges larger than the buffer."""
+    # Generate file data that is larger than the buffer used for individual
+    # offsets.
+    test_data = b''.join([
+        '{0:08x}'.format(offset).encode('ascii')
+        for offset in range(0, 256 * 1024, 8)])
+
+    test_path_spec = fake_path_spec.FakePathSpec(location='/test.bin')
+    file_object = fake_file_io.FakeFile(self._resolver_context, test_data)
+    file_object.open(test_path_spec)
+
+    try:
+      file_data = data_slice.DataSlice(file_object)
+      buffer_size = file_data._BUFFER_SIZE
+
+      # Test read that crosses the boundary of the buffer used for individual
+      # offsets.
+      self.assertEqual(
+          file_data[buffer_size - 1], test_data[buffer_size - 1:buffer_size])
+
+      memory_view = file_data.GetMemoryView(buffer_size - 8, buffer_size + 8)
+      self.assertEqual(
+          memory_view.tobytes(), test_data[buffer_size - 8:buffer_size + 8])
+
+      self.assertEqual(
+          file_data[buffer_size - 8:buffer_size + 8],
+          test_data[buffer_size - 8:buffer_size + 8])
+
+      # Test that the reused read buffer does not exceed its maximum size.
+      file_data._MAXIMUM_READ_BUFFER_SIZE = 2 * buffer_size
+
+      memory_view = file_data.GetMemoryView(0, 3 * buffer_size)
+      self.assertEqual(memory_view.tobytes(), test_data[:3 * buffer_size])
+      self.assertLessEqual(
+          len(file_data._read_buffer), file_data._MAXIMUM_READ_BUFFER_SIZE)
+
+      memory_view = file_data.GetMemoryView(8, 2 * buffer_size)
+      self.assertEqual(memory_view.tobytes(), test_data[8:2 * buffer_size])
+      self.assertEqual(len(file_data._read_buffer), 2 * buffer_size - 8)
+
+      memory_view = file_data.GetMemoryView(0, len(test_data))
+      self.assertEqual(memory_view.tobytes(), test_data)
+      self.assertEqual(len(file_data._read_buffer), 2 * buffer_size - 8)
+
+    finally:
+      file_object.close()
+
   def testLen(self):
     """Test the __len__ function."""
     test_file = self._GetTestFilePath(['password.txt'])
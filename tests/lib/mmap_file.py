@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the memory mapped file support helper functions."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.file_io import os_file_io
+from dfvfs.lib import mmap_file
+from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class MemoryMappedFileTest(shared_test_lib.BaseTestCase):
+  """Tests for the memory mapped file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath(['password.txt'])
+    self._SkipIfPathNotExists(test_file)
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def testOpenMemoryMappedFile(self):
+    """Tests the OpenMemoryMappedFile function."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._os_path_spec)
+
+    memory_mapped_file = mmap_file.OpenMemoryMappedFile(file_object)
+    self.assertIsNotNone(memory_mapped_file)
+
+    memory_mapped_file.close()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/test_data/password.txt')
+    file_object = fake_file_io.FakeFile(
+        self._resolver_context, b'place,user,password\n')
+    file_object.open(path_spec=path_spec)
+
+    memory_mapped_file = mmap_file.OpenMemoryMappedFile(file_object)
+    self.assertIsNone(memory_mapped_file)
+
+    file_object.close()
+
+  def testReadAndSeek(self):
+    """Tests the read and seek functions."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._os_path_spec)
+
+    memory_mapped_file = mmap_file.OpenMemoryMappedFile(file_object)
+
+    try:
+      self.assertEqual(memory_mapped_file.get_size(), 116)
+      self.assertEqual(memory_mapped_file.read(20), b'place,user,password\n')
+      self.assertEqual(memory_mapped_file.get_offset(), 20)
+
+      memory_mapped_file.seek(-30, os.SEEK_END)
+      self.assertEqual(
+          memory_mapped_file.read(), b'uber secret laire,admin,admin\n')
+
+      memory_mapped_file.seek(-52, os.SEEK_CUR)
+      self.assertEqual(memory_mapped_file.read(22), b'treasure chest,-,1111\n')
+
+      memory_mapped_file.seek(200, os.SEEK_SET)
+      self.assertEqual(memory_mapped_file.get_offset(), 200)
+      self.assertEqual(memory_mapped_file.read(16), b'')
+
+      with self.assertRaises(IOError):
+        memory_mapped_file.seek(-10, os.SEEK_SET)
+
+      with self.assertRaises(IOError):
+        memory_mapped_file.seek(10, 5)
+
+    finally:
+      memory_mapped_file.close()
+
+    with self.assertRaises(IOError):
+      memory_mapped_file.read(1)
+
+
+if __name__ == '__main__':
+  unittest.main()
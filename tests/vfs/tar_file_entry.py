@@ -4,6 +4,11 @@
 
 from __future__ import unicode_literals
 
+import io
+import os
+import shutil
+import tarfile
+import tempfile
 import unittest
 
 from dfvfs.path import os_path_spec
@@ -158,6 +163,40 @@ class TARFileEntryTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testSubFileEntriesOrder(self):
+    """Test the order of the sub file entries."""
+    temporary_directory = tempfile.mkdtemp()
+    try:
+      # The member names are chosen so that sorting them by their full name
+      # differs from sorting the directory entries by their location.
+      test_file = os.path.join(temporary_directory, 'order.tar')
+      with tarfile.open(test_file, 'w') as tar_file:
+        for name in ('a/f4', 'a/b/c', 'a/b-x'):
+          tar_info = tarfile.TarInfo(name=name)
+          tar_info.size = 4
+          tar_file.addfile(tar_info, io.BytesIO(b'test'))
+
+      path_spec = os_path_spec.OSPathSpec(location=test_file)
+      path_spec = tar_path_spec.TARPathSpec(location='/a', parent=path_spec)
+
+      file_system = tar_file_system.TARFileSystem(self._resolver_context)
+      file_system.Open(path_spec)
+
+      try:
+        file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+        self.assertIsNotNone(file_entry)
+
+        sub_file_entry_names = [
+            sub_file_entry.name
+            for sub_file_entry in file_entry.sub_file_entries]
+        self.assertEqual(sub_file_entry_names, ['b', 'b-x', 'f4'])
+
+      finally:
+        file_system.Close()
+
+    finally:
+      shutil.rmtree(temporary_directory, True)
+
   def testDataStreams(self):
     """Test the data streams functionality."""
     path_spec = tar_path_spec.TARPathSpec(
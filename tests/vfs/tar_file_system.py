@@ -47,10 +47,20 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
         location='/syslog', parent=self._os_path_spec)
     self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    # A trailing path separator is ignored.
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/syslog/', parent=self._os_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
     path_spec = tar_path_spec.TARPathSpec(
         location='/bogus', parent=self._os_path_spec)
     self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    # A prefix of a name is not a virtual directory.
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/sys', parent=self._os_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
     file_system.Close()
 
     # Test on a tar file that has missing directory entries.
@@ -73,6 +83,15 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
         location='/File System/Recordings', parent=test_file_path_spec)
     self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    # A trailing path separator is ignored.
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/File System/', parent=test_file_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/Non Missing Directory Entry/', parent=test_file_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
     file_system.Close()
 
   def testGetFileEntryByPathSpec(self):
@@ -89,12 +108,27 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, 'syslog')
 
+    # A trailing path separator is ignored.
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/syslog/', parent=self._os_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNotNone(file_entry)
+    self.assertFalse(file_entry.IsVirtual())
+
     path_spec = tar_path_spec.TARPathSpec(
         location='/bogus', parent=self._os_path_spec)
     file_entry = file_system.GetFileEntryByPathSpec(path_spec)
 
     self.assertIsNone(file_entry)
 
+    # A prefix of a name is not a virtual directory.
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/sys', parent=self._os_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNone(file_entry)
+
     file_system.Close()
 
     # Test on a tar file that has missing directory entries.
@@ -121,6 +155,24 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, 'Recordings')
 
+    # A trailing path separator is ignored.
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/File System/', parent=test_file_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+    self.assertTrue(file_entry.IsVirtual())
+
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/Non Missing Directory Entry/', parent=test_file_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+    self.assertFalse(file_entry.IsVirtual())
+    self.assertTrue(file_entry.IsDirectory())
+
+    sub_file_entry_names = [
+        sub_file_entry.name for sub_file_entry in file_entry.sub_file_entries]
+    self.assertEqual(sub_file_entry_names, ['test_file.txt'])
+
     file_system.Close()
 
   def testGetRootFileEntry(self):
@@ -137,6 +189,64 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetTARInfoByPathSpec(self):
+    """Tests the GetTARInfoByPathSpec function."""
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tar_path_spec)
+
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/syslog', parent=self._os_path_spec)
+    tar_info = file_system.GetTARInfoByPathSpec(path_spec)
+    self.assertIsNotNone(tar_info)
+    self.assertEqual(tar_info.name, 'syslog')
+
+    # A trailing path separator is ignored.
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/syslog/', parent=self._os_path_spec)
+    tar_info = file_system.GetTARInfoByPathSpec(path_spec)
+    self.assertIsNotNone(tar_info)
+    self.assertEqual(tar_info.name, 'syslog')
+
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/bogus', parent=self._os_path_spec)
+    tar_info = file_system.GetTARInfoByPathSpec(path_spec)
+    self.assertIsNone(tar_info)
+
+    file_system.Close()
+
+  def testGetTARInfosWithNamePrefix(self):
+    """Tests the GetTARInfosWithNamePrefix function."""
+    test_file = self._GetTestFilePath(['missing_directory_entries.tar'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/', parent=test_file_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+    file_system.Open(path_spec)
+
+    names = [
+        tar_info.name for tar_info in file_system.GetTARInfosWithNamePrefix(
+            'Non Missing')]
+    self.assertEqual(names, [
+        'Non Missing Directory Entry',
+        'Non Missing Directory Entry/test_file.txt'])
+
+    names = [
+        tar_info.name for tar_info in file_system.GetTARInfosWithNamePrefix('')]
+    self.assertEqual(len(names), 3)
+
+    names = [
+        tar_info.name for tar_info in file_system.GetTARInfosWithNamePrefix(
+            'bogus')]
+    self.assertEqual(names, [])
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
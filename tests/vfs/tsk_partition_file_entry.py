@@ -138,6 +138,32 @@ class TSKPartitionFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), sorted(expected_sub_file_entry_names))
 
+  def testSubFileEntriesSize(self):
+    """Test the size of the sub file entries."""
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        location='/', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    for sub_file_entry in file_entry.sub_file_entries:
+      stat_object = sub_file_entry.GetStat()
+
+      file_object = sub_file_entry.GetFileObject()
+      try:
+        self.assertEqual(stat_object.size, file_object.get_size())
+      finally:
+        file_object.close()
+
+      # The file entry retrieved by path specification should refer to the
+      # same part as the sub file entry.
+      path_spec_file_entry = self._file_system.GetFileEntryByPathSpec(
+          sub_file_entry.path_spec)
+      self.assertIsNotNone(path_spec_file_entry)
+      self.assertEqual(path_spec_file_entry.GetStat().size, stat_object.size)
+      self.assertEqual(
+          path_spec_file_entry.GetTSKVsPart().addr,
+          sub_file_entry.GetTSKVsPart().addr)
+
   def testDataStreams(self):
     """Test the data streams functionality."""
     path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
@@ -90,6 +90,19 @@ class TSKPartitionFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetBytesPerSector(self):
+    """Test the GetBytesPerSector function."""
+    file_system = tsk_partition_file_system.TSKPartitionFileSystem(
+        self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tsk_partition_path_spec)
+
+    bytes_per_sector = file_system.GetBytesPerSector()
+    self.assertEqual(bytes_per_sector, 512)
+
+    file_system.Close()
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     file_system = tsk_partition_file_system.TSKPartitionFileSystem(
@@ -161,6 +174,20 @@ class TSKPartitionFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetTSKVsParts(self):
+    """Test the GetTSKVsParts function."""
+    file_system = tsk_partition_file_system.TSKPartitionFileSystem(
+        self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tsk_partition_path_spec)
+
+    tsk_vs_parts = file_system.GetTSKVsParts()
+    self.assertIsInstance(tsk_vs_parts, tuple)
+    self.assertEqual(len(tsk_vs_parts), 7)
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()